@@ -1,11 +1,145 @@
+import os
+import time
+import hashlib
 import yfinance as yf
 import pandas as pd
 import numpy as np
+import bottleneck as bn
+from numba import njit
 from typing import Optional, Tuple
 from datetime import datetime, timedelta
 
+CACHE_DIR = 'cache'
+
+# Indicator parameters; any change produces a new preprocessed-data cache key
+VOL_WINDOW = 20
+EMA_SPAN = 20
+BAND_MULT = 2
+INDICATOR_CONFIG_HASH = hashlib.sha1(
+    repr(dict(window_vol=VOL_WINDOW, ema_span=EMA_SPAN, rank_window=None, band_mult=BAND_MULT,
+              dtype='float32')).encode()
+).hexdigest()[:12]
+
+@njit(cache=True)
+def _ema(x: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponential moving average, equivalent to ewm(alpha=alpha, adjust=False).mean().
+    
+    Like pandas, the average is seeded from the first non-NaN value and NaN
+    inputs carry the previous average forward, with the weight of the old
+    average still decaying across the gap.
+    
+    Args:
+        x (np.ndarray): Input series
+        alpha (float): Smoothing factor
+        
+    Returns:
+        np.ndarray: EMA of the input series
+    """
+    y = np.empty_like(x)
+    weighted = np.nan
+    old_wt = 1.0
+    for i in range(x.size):
+        cur = x[i]
+        if weighted == weighted:
+            old_wt *= 1 - alpha
+            if cur == cur:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif cur == cur:
+            weighted = cur
+        y[i] = weighted
+    return y
+
+@njit(cache=True)
+def _fenwick_pct_rank(codes: np.ndarray, n_bins: int) -> np.ndarray:
+    """
+    Expanding percentile rank of pre-binned values using a Fenwick tree of bin counts.
+    
+    Args:
+        codes (np.ndarray): Bin index of each value, -1 for missing values
+        n_bins (int): Number of distinct bins
+        
+    Returns:
+        np.ndarray: Percentile rank of each value among all values up to it
+    """
+    out = np.full(codes.size, np.nan)
+    tree = np.zeros(n_bins + 1, dtype=np.int64)
+    count = 0
+    for i in range(codes.size):
+        if codes[i] < 0:
+            continue
+        j = codes[i] + 1
+        while j <= n_bins:
+            tree[j] += 1
+            j += j & -j
+        count += 1
+        
+        # Number of values seen so far that are <= and < the current one
+        less_equal = 0
+        j = codes[i] + 1
+        while j > 0:
+            less_equal += tree[j]
+            j -= j & -j
+        less = 0
+        j = codes[i]
+        while j > 0:
+            less += tree[j]
+            j -= j & -j
+            
+        # Ties share their average rank, as in pandas rank(method='average')
+        out[i] = (less + (less_equal - less + 1) / 2) / count
+    return out
+
+def _expanding_pct_rank(x: np.ndarray) -> np.ndarray:
+    """
+    Equivalent of pd.Series(x).expanding().rank(pct=True) in O(n log n).
+    
+    Args:
+        x (np.ndarray): Input series
+        
+    Returns:
+        np.ndarray: Expanding percentile rank
+    """
+    valid = ~np.isnan(x)
+    codes = np.full(x.size, -1, dtype=np.int64)
+    bins, codes[valid] = np.unique(x[valid], return_inverse=True)
+    return _fenwick_pct_rank(codes, bins.size)
+
+def _move_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean over full windows, equivalent to rolling(window).mean().
+    
+    Args:
+        x (np.ndarray): Input series
+        window (int): Window length
+        
+    Returns:
+        np.ndarray: Rolling mean, all NaN if the series is shorter than the window
+    """
+    if x.size < window:
+        return np.full(x.size, np.nan, dtype=np.result_type(x.dtype, np.float32))
+    return bn.move_mean(x, window=window, min_count=window)
+
+def _move_std(x: np.ndarray, window: int, ddof: int = 0) -> np.ndarray:
+    """
+    Rolling standard deviation over full windows, equivalent to rolling(window).std(ddof=ddof).
+    
+    Args:
+        x (np.ndarray): Input series
+        window (int): Window length
+        ddof (int): Delta degrees of freedom
+        
+    Returns:
+        np.ndarray: Rolling standard deviation, all NaN if the series is shorter than the window
+    """
+    if x.size < window:
+        return np.full(x.size, np.nan, dtype=np.result_type(x.dtype, np.float32))
+    return bn.move_std(x, window=window, min_count=window, ddof=ddof)
+
 class DataLoader:
-    def __init__(self, symbol: str, start_date: str, end_date: str):
+    def __init__(self, symbol: str, start_date: str, end_date: str, interval: str = '1d'):
         """
         Initialize the data loader with symbol and date range.
         
@@ -13,12 +147,67 @@ class DataLoader:
             symbol (str): Stock/ETF symbol (e.g., 'SPY')
             start_date (str): Start date in 'YYYY-MM-DD' format
             end_date (str): End date in 'YYYY-MM-DD' format
+            interval (str): Bar interval passed to Yahoo Finance (default: '1d')
         """
         self.symbol = symbol
         self.start_date = start_date
         self.end_date = end_date
+        self.interval = interval
         self.data = None
         
+    def _cache_path(self, kind: str) -> str:
+        """
+        Get the cache file path for this symbol, date range and interval.
+        
+        Processed data is additionally keyed on INDICATOR_CONFIG_HASH, so
+        changing an indicator parameter never reuses a stale frame.
+        
+        Args:
+            kind (str): Cache subdirectory, 'ohlcv' for raw downloads or 'preproc' for processed data
+            
+        Returns:
+            str: Path of the Parquet cache file
+        """
+        filename = f"{self.symbol}_{self.start_date}_{self.end_date}_{self.interval}"
+        if kind == 'preproc':
+            filename += f"_{INDICATOR_CONFIG_HASH}"
+        filename += '.parquet'
+        return os.path.join(CACHE_DIR, kind, filename)
+        
+    def _read_cache(self, path: str) -> Optional[pd.DataFrame]:
+        """
+        Read a cached DataFrame if it exists and is younger than QV_CACHE_TTL_HOURS (default: 24).
+        
+        Args:
+            path (str): Path of the Parquet cache file
+            
+        Returns:
+            Optional[pd.DataFrame]: Cached DataFrame, or None on a miss
+        """
+        try:
+            ttl_hours = float(os.environ.get('QV_CACHE_TTL_HOURS', 24))
+            if time.time() - os.path.getmtime(path) > ttl_hours * 3600:
+                return None
+            return pd.read_parquet(path)
+        except Exception:
+            return None
+            
+    def _write_cache(self, data: pd.DataFrame, path: str) -> None:
+        """
+        Write a DataFrame to the cache. Failures are ignored since the cache is only an optimization.
+        
+        Args:
+            data (pd.DataFrame): DataFrame to cache
+            path (str): Path of the Parquet cache file
+        """
+        if data is None or data.empty:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data.to_parquet(path, compression='zstd')
+        except Exception:
+            pass
+        
     def fetch_data(self) -> pd.DataFrame:
         """
         Fetch OHLCV data from Yahoo Finance.
@@ -27,24 +216,38 @@ class DataLoader:
             pd.DataFrame: DataFrame containing OHLCV data
         """
         try:
-            ticker = yf.Ticker(self.symbol)
-            self.data = ticker.history(
-                start=self.start_date,
-                end=self.end_date,
-                interval='1d'
-            )
+            cache_path = self._cache_path('ohlcv')
+            self.data = self._read_cache(cache_path)
+            if self.data is None:
+                ticker = yf.Ticker(self.symbol)
+                self.data = ticker.history(
+                    start=self.start_date,
+                    end=self.end_date,
+                    interval=self.interval
+                )
+                self._write_cache(self.data, cache_path)
+                
+            # Indicators only need single precision, which halves memory traffic in the
+            # kernels below. Close stays float64 so trade PnL is exact, and Volume stays
+            # as is since float32 cannot hold share counts above 2**24 exactly.
+            price_cols = ['Open', 'High', 'Low']
+            self.data[price_cols] = self.data[price_cols].astype(np.float32)
+            close = self.data['Close'].to_numpy(dtype=np.float32)
             
             # Calculate daily returns
-            self.data['Returns'] = self.data['Close'].pct_change()
+            self.data['Returns'] = pd.Series(close, index=self.data.index).pct_change()
             
             # Calculate 20-day rolling volatility
-            self.data['Volatility'] = self.data['Returns'].rolling(window=20).std() * np.sqrt(252)  # Annualized
+            volatility = _move_std(self.data['Returns'].to_numpy(), VOL_WINDOW, ddof=1)
+            self.data['Volatility'] = pd.Series(volatility, index=self.data.index) * np.float32(np.sqrt(252))  # Annualized
             
             # Calculate 20-day EMA
-            self.data['EMA_20'] = self.data['Close'].ewm(span=20, adjust=False).mean()
+            ema = _ema(close, 2.0 / (EMA_SPAN + 1))
+            self.data['EMA_20'] = pd.Series(ema, index=self.data.index)
             
             # Calculate volatility percentile (using expanding window instead of rolling)
-            self.data['Vol_Percentile'] = self.data['Volatility'].expanding().rank(pct=True)
+            vol_percentile = _expanding_pct_rank(self.data['Volatility'].to_numpy())
+            self.data['Vol_Percentile'] = pd.Series(vol_percentile, index=self.data.index)
             
             return self.data
             
@@ -62,8 +265,9 @@ class DataLoader:
             return pd.DataFrame()
             
         # Calculate standard deviation bands
-        self.data['Upper_Band'] = self.data['EMA_20'] + 2 * self.data['Volatility']
-        self.data['Lower_Band'] = self.data['EMA_20'] - 2 * self.data['Volatility']
+        ema = self.data['EMA_20'].to_numpy()
+        band_width = np.float32(BAND_MULT) * self.data['Volatility'].to_numpy()
+        self.data[['Upper_Band', 'Lower_Band']] = np.column_stack((ema + band_width, ema - band_width))
         
         # Drop NaN values
         self.data = self.data.dropna()
@@ -78,6 +282,10 @@ class DataLoader:
             pd.DataFrame: Complete processed dataset
         """
         if self.data is None or self.data.empty:
-            self.fetch_data()
-            self.preprocess_data()
+            cache_path = self._cache_path('preproc')
+            self.data = self._read_cache(cache_path)
+            if self.data is None:
+                self.fetch_data()
+                self.preprocess_data()
+                self._write_cache(self.data, cache_path)
         return self.data 
\ No newline at end of file
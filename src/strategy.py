@@ -3,11 +3,64 @@ sys.path.append('.')  # Add current directory to Python path
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-from src.data_loader import DataLoader
+from numba import njit
+from src.data_loader import DataLoader, _move_mean, _move_std
 from src.visualization import StrategyVisualizer
-from src.trade import Trade
+from src.trade import Trade, TradeBuffer
+
+@njit(cache=True)
+def _scan_trades(long_entry, short_entry, exit_long, exit_short, days, start, max_hold,
+                 entry_idx, exit_idx, position):
+    """
+    Walk the entry/exit masks once and write the trades they produce into the output arrays.
+    
+    Args:
+        long_entry (np.ndarray): Boolean long entry mask
+        short_entry (np.ndarray): Boolean short entry mask
+        exit_long (np.ndarray): Boolean exit mask for long positions
+        exit_short (np.ndarray): Boolean exit mask for short positions
+        days (np.ndarray): Bar dates as integer day numbers
+        start (int): Number of warm-up bars to skip
+        max_hold (int): Calendar days after which a position is closed
+        entry_idx (np.ndarray): Output entry bar indices
+        exit_idx (np.ndarray): Output exit bar indices
+        position (np.ndarray): Output positions
+        
+    Returns:
+        int: Number of trades written
+    """
+    n = long_entry.size
+    count = 0
+    pos = 0
+    entry = 0
+    
+    for i in range(start, n):
+        if pos != 0:
+            # The timeout is checked against the holding period as of the previous bar
+            if (pos == 1 and exit_long[i]) or (pos == -1 and exit_short[i]) or \
+               days[i - 1] - days[entry] >= max_hold:
+                entry_idx[count] = entry
+                exit_idx[count] = i
+                position[count] = pos
+                count += 1
+                pos = 0
+        elif long_entry[i]:
+            pos = 1
+            entry = i
+        elif short_entry[i]:
+            pos = -1
+            entry = i
+    
+    # Close any remaining open trade on the last bar
+    if pos != 0:
+        entry_idx[count] = entry
+        exit_idx[count] = n - 1
+        position[count] = pos
+        count += 1
+        
+    return count
 
 class VolatilityRegimeStrategy:
     def __init__(self, data: pd.DataFrame, initial_capital: float = 100000.0):
@@ -20,33 +73,71 @@ class VolatilityRegimeStrategy:
         """
         self.data = data
         self.initial_capital = initial_capital
-        self.current_capital = initial_capital
-        self.position = 0
-        self.trades: List[Trade] = []
-        self.current_trade = None
+        self.trade_buffer = TradeBuffer(0)
+        self._trades = None
+        # (data, extent, signals) of the last generate_signals call
+        self._signal_cache: Optional[Tuple[pd.DataFrame, Tuple, pd.DataFrame]] = None
+        
+    @property
+    def trades(self) -> List[Trade]:
+        """
+        Trades from the last backtest, materialized from the trade buffer on first access.
+        
+        Returns:
+            List[Trade]: List of completed trades
+        """
+        if self._trades is None:
+            self._trades = self.trade_buffer.to_trades(self.data.index, self.data['Close'].to_numpy())
+        return self._trades
+        
+    def clear_signal_cache(self) -> None:
+        """
+        Drop the memoized signals, e.g. after modifying the data frame in place.
+        """
+        self._signal_cache = None
         
     def generate_signals(self) -> pd.DataFrame:
         """
         Generate trading signals based on volatility regime and price deviation.
         
+        Signals for the current data frame are memoized on the instance, so
+        repeated backtests on the same data skip the indicator computation.
+        
         Returns:
             pd.DataFrame: DataFrame with trading signals
         """
+        cols = ['Price_Deviation', 'Deviation_Std', 'RSI']
+        # Empty frames are cheap to process and have no extent to key on
+        key = (
+            self.data.index[0].value,
+            self.data.index[-1].value,
+            len(self.data),
+            float(self.data['Close'].iloc[-1])
+        ) if len(self.data) else None
+        if key is not None and self._signal_cache is not None:
+            data, cached_key, cached = self._signal_cache
+            if data is self.data and cached_key == key and set(cols).issubset(self.data.columns):
+                return cached
+            
         signals = pd.DataFrame(index=self.data.index)
         
         # Calculate indicators
-        self.data['Price_Deviation'] = (self.data['Close'] - self.data['EMA_20']) / self.data['EMA_20']
-        self.data['Deviation_Std'] = self.data['Price_Deviation'].rolling(window=20).std()
+        close = self.data['Close'].to_numpy(dtype=np.float32)
+        ema = self.data['EMA_20'].to_numpy(dtype=np.float32)
+        self.data['Price_Deviation'] = pd.Series((close - ema) / ema, index=self.data.index)
+        deviation_std = _move_std(self.data['Price_Deviation'].to_numpy(), 20, ddof=1)
+        self.data['Deviation_Std'] = pd.Series(deviation_std, index=self.data.index)
         
         # Calculate RSI
-        delta = self.data['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
+        delta = np.diff(close, prepend=close[:1])
+        gain = _move_mean(np.where(delta > 0, delta, 0.0), 14)
+        loss = _move_mean(np.where(delta < 0, -delta, 0.0), 14)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = gain / loss
         self.data['RSI'] = 100 - (100 / (1 + rs))
         
-        # Fill NaN values
-        self.data = self.data.fillna(method='ffill').fillna(method='bfill')
+        # Fill NaN values in the indicator columns used below
+        self.data[cols] = self.data[cols].ffill().bfill()
         
         # Generate signals with balanced conditions
         signals['long_entry'] = (
@@ -61,6 +152,8 @@ class VolatilityRegimeStrategy:
             (self.data['RSI'] > 65)  # Overbought
         )
         
+        if key is not None:
+            self._signal_cache = (self.data, key, signals)
         return signals
         
     def run_backtest(self) -> Dict:
@@ -71,99 +164,46 @@ class VolatilityRegimeStrategy:
             Dict: Dictionary containing performance metrics
         """
         signals = self.generate_signals()
-        self.trades = []
-        self.position = 0
-        self.current_capital = self.initial_capital
-        self.current_trade = None
-        
-        for i in range(len(self.data)):
-            if i < 20:  # Skip the first 20 days
-                continue
-                
-            current_date = self.data.index[i]
-            current_price = self.data['Close'].iloc[i]
-            
-            # Check for exit signals first
-            if self.position != 0 and self.current_trade is not None:
-                price_deviation = self.data['Price_Deviation'].iloc[i]
-                deviation_std = self.data['Deviation_Std'].iloc[i]
-                rsi = self.data['RSI'].iloc[i]
-                
-                exit_signal = False
-                
-                # Mean reversion exit
-                if (self.position == 1 and price_deviation > -0.5 * deviation_std) or \
-                   (self.position == -1 and price_deviation < 0.5 * deviation_std):
-                    exit_signal = True
-                
-                # RSI extreme exit
-                elif (self.position == 1 and rsi > 50) or (self.position == -1 and rsi < 50):
-                    exit_signal = True
-                
-                # Stop loss
-                elif (self.position == 1 and price_deviation < -1.8 * deviation_std) or \
-                     (self.position == -1 and price_deviation > 1.8 * deviation_std):
-                    exit_signal = True
-                
-                # Time-based exit (7 days)
-                elif self.current_trade.holding_period >= 7:
-                    exit_signal = True
-                
-                if exit_signal:
-                    self.current_trade.exit_date = current_date
-                    self.current_trade.exit_price = current_price
-                    self.current_trade.holding_period = (current_date - self.current_trade.entry_date).days
-                    
-                    if self.position == 1:
-                        self.current_trade.pnl = (current_price - self.current_trade.entry_price) / self.current_trade.entry_price
-                    else:
-                        self.current_trade.pnl = (self.current_trade.entry_price - current_price) / self.current_trade.entry_price
-                    
-                    self.trades.append(self.current_trade)
-                    self.position = 0
-                    self.current_trade = None
-            
-            # Check for entry signals
-            elif self.position == 0:
-                if signals['long_entry'].iloc[i]:
-                    self.position = 1
-                    self.current_trade = Trade(
-                        entry_date=current_date,
-                        exit_date=None,
-                        entry_price=current_price,
-                        exit_price=None,
-                        position=1,
-                        pnl=0.0,
-                        holding_period=0
-                    )
-                    
-                elif signals['short_entry'].iloc[i]:
-                    self.position = -1
-                    self.current_trade = Trade(
-                        entry_date=current_date,
-                        exit_date=None,
-                        entry_price=current_price,
-                        exit_price=None,
-                        position=-1,
-                        pnl=0.0,
-                        holding_period=0
-                    )
-            
-            if self.current_trade is not None:
-                self.current_trade.holding_period = (current_date - self.current_trade.entry_date).days
-        
-        # Close any remaining open trade
-        if self.current_trade is not None:
-            self.current_trade.exit_date = self.data.index[-1]
-            self.current_trade.exit_price = self.data['Close'].iloc[-1]
-            self.current_trade.holding_period = (self.current_trade.exit_date - self.current_trade.entry_date).days
-            
-            if self.position == 1:
-                self.current_trade.pnl = (self.current_trade.exit_price - self.current_trade.entry_price) / self.current_trade.entry_price
-            else:
-                self.current_trade.pnl = (self.current_trade.entry_price - self.current_trade.exit_price) / self.current_trade.entry_price
-            
-            self.trades.append(self.current_trade)
+        self.trade_buffer = TradeBuffer(len(self.data))
+        self._trades = None
+        
+        close = self.data['Close'].to_numpy()
+        price_deviation = self.data['Price_Deviation'].to_numpy()
+        deviation_std = self.data['Deviation_Std'].to_numpy()
+        rsi = self.data['RSI'].to_numpy()
+        days = self.data.index.tz_localize(None).values.astype('datetime64[D]').astype(np.int64)
+        
+        # Mean reversion exit, RSI extreme exit and stop loss for each side
+        exit_long = (
+            (price_deviation > -0.5 * deviation_std) |
+            (rsi > 50) |
+            (price_deviation < -1.8 * deviation_std)
+        )
+        exit_short = (
+            (price_deviation < 0.5 * deviation_std) |
+            (rsi < 50) |
+            (price_deviation > 1.8 * deviation_std)
+        )
+        
+        buf = self.trade_buffer
+        buf.count = _scan_trades(
+            signals['long_entry'].to_numpy(),
+            signals['short_entry'].to_numpy(),
+            exit_long,
+            exit_short,
+            days,
+            20,  # Skip the first 20 days
+            7,  # Time-based exit (7 days)
+            buf.entry_idx,
+            buf.exit_idx,
+            buf.position
+        )
+        
+        n = buf.count
+        entry_price = close[buf.entry_idx[:n]]
+        exit_price = close[buf.exit_idx[:n]]
+        buf.pnl[:n] = buf.position[:n] * (exit_price - entry_price) / entry_price
+        buf.holding_period[:n] = days[buf.exit_idx[:n]] - days[buf.entry_idx[:n]]
         
         return self.calculate_metrics()
         
@@ -174,7 +214,8 @@ class VolatilityRegimeStrategy:
         Returns:
             Dict: Dictionary containing performance metrics
         """
-        if not self.trades:
+        total_trades = len(self.trade_buffer)
+        if total_trades == 0:
             return {
                 'total_trades': 0,
                 'win_rate': 0,
@@ -185,27 +226,22 @@ class VolatilityRegimeStrategy:
             }
             
         # Calculate basic metrics
-        total_trades = len(self.trades)
-        winning_trades = sum(1 for trade in self.trades if trade.pnl > 0)
-        win_rate = winning_trades / total_trades
-        
-        # Calculate returns
-        returns = [trade.pnl for trade in self.trades]
-        avg_return = np.mean(returns)
+        returns = self.trade_buffer.pnl[:total_trades]
+        win_rate = np.count_nonzero(returns > 0) / total_trades
+        avg_return = returns.mean()
         
         # Calculate Sharpe ratio
         risk_free_rate = 0.02  # 2% annual risk-free rate
-        excess_returns = np.array(returns) - risk_free_rate/252
-        sharpe_ratio = np.sqrt(252) * np.mean(excess_returns) / np.std(excess_returns)
+        excess_returns = returns - risk_free_rate/252
+        sharpe_ratio = np.sqrt(252) * excess_returns.mean() / excess_returns.std()
         
         # Calculate max drawdown
-        cumulative_returns = np.cumprod(1 + np.array(returns))
+        cumulative_returns = np.cumprod(1 + returns)
         rolling_max = np.maximum.accumulate(cumulative_returns)
-        drawdowns = (cumulative_returns - rolling_max) / rolling_max
-        max_drawdown = np.min(drawdowns)
+        max_drawdown = ((cumulative_returns - rolling_max) / rolling_max).min()
         
         # Calculate CAGR
-        total_return = np.prod(1 + np.array(returns)) - 1
+        total_return = cumulative_returns[-1] - 1
         years = (self.data.index[-1] - self.data.index[0]).days / 365
         cagr = (1 + total_return) ** (1/years) - 1
         
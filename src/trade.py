@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import List
+import numpy as np
+import pandas as pd
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     entry_date: datetime
     exit_date: datetime
@@ -9,4 +12,49 @@ class Trade:
     exit_price: float
     position: int  # 1 for long, -1 for short
     pnl: float
-    holding_period: int 
\ No newline at end of file
+    holding_period: int
+
+class TradeBuffer:
+    __slots__ = ('entry_idx', 'exit_idx', 'position', 'pnl', 'holding_period', 'count')
+    
+    def __init__(self, capacity: int):
+        """
+        Preallocate columnar storage for up to `capacity` trades.
+        
+        Args:
+            capacity (int): Maximum number of trades, e.g. the number of bars
+        """
+        self.entry_idx = np.empty(capacity, dtype=np.int64)
+        self.exit_idx = np.empty(capacity, dtype=np.int64)
+        self.position = np.empty(capacity, dtype=np.int64)
+        self.pnl = np.empty(capacity, dtype=np.float64)
+        self.holding_period = np.empty(capacity, dtype=np.int64)
+        self.count = 0
+        
+    def __len__(self) -> int:
+        return self.count
+        
+    def to_trades(self, index: pd.DatetimeIndex, prices: np.ndarray) -> List[Trade]:
+        """
+        Materialize the stored trades as Trade objects.
+        
+        Args:
+            index (pd.DatetimeIndex): Bar dates the stored indices refer to
+            prices (np.ndarray): Bar prices the stored indices refer to
+            
+        Returns:
+            List[Trade]: One Trade per stored trade
+        """
+        n = self.count
+        return [
+            Trade(
+                entry_date=index[self.entry_idx[k]],
+                exit_date=index[self.exit_idx[k]],
+                entry_price=prices[self.entry_idx[k]],
+                exit_price=prices[self.exit_idx[k]],
+                position=int(self.position[k]),
+                pnl=self.pnl[k],
+                holding_period=int(self.holding_period[k])
+            )
+            for k in range(n)
+        ]
@@ -1,12 +1,68 @@
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
+from __future__ import annotations
 import pandas as pd
 import numpy as np
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple, TYPE_CHECKING
+from numba import njit
+from concurrent.futures import ThreadPoolExecutor
 from src.trade import Trade
 import os
 
+# matplotlib is imported on first plot, so importing this module (e.g. via
+# src.strategy) does not pay for it when only backtesting
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+@lru_cache(maxsize=1)
+def _get_plt():
+    """
+    Import pyplot with the non-interactive Agg backend.
+    
+    Returns:
+        module: matplotlib.pyplot
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+    return plt
+
+@njit(cache=True)
+def _equity_and_dd(idx, pnls, eq, dd):
+    """
+    Build the equity and drawdown curves in a single pass, writing into the given buffers.
+    
+    Returns are compounded in double precision; only the stored curves may be
+    single precision.
+    
+    Args:
+        idx (np.ndarray): Bar index at which each trade's return is realized, sorted ascending
+        pnls (np.ndarray): Return of each trade, in the same order as idx
+        eq (np.ndarray): Output equity values starting from 1.0, one per bar
+        dd (np.ndarray): Output drawdown, one per bar
+    """
+    k = 0
+    cur = 1.0
+    mx = 1.0
+    for i in range(eq.size):
+        while k < idx.size and idx[k] == i:
+            cur *= 1.0 + pnls[k]
+            k += 1
+        if cur > mx:
+            mx = cur
+        eq[i] = cur
+        dd[i] = (cur - mx) / mx
+
+def _save_png(path: str, image: np.ndarray) -> None:
+    """
+    Encode an RGBA pixel array as PNG and write it to disk.
+    
+    Args:
+        path (str): Output file path
+        image (np.ndarray): RGBA pixels, shape (height, width, 4)
+    """
+    from matplotlib.image import imsave
+    imsave(path, image)
+
 class StrategyVisualizer:
     def __init__(self, data: pd.DataFrame, trades: List[Trade]):
         """
@@ -16,9 +72,63 @@ class StrategyVisualizer:
             data (pd.DataFrame): Market data
             trades (List[Trade]): List of trades from backtest
         """
+        assert data.index.is_monotonic_increasing, 'data must be sorted by date'
         self.data = data
         self.trades = trades
         
+        # Plain arrays for the plots, so matplotlib never has to convert pandas objects
+        self._x = data.index.values
+        self._close = data['Close'].to_numpy()
+        self._vol = data['Volatility'].to_numpy()
+        
+        # Equity/drawdown buffers, allocated on first use and refilled when trades change
+        self._buf_eq = None
+        self._buf_dd = None
+        
+    @property
+    def trades(self) -> List[Trade]:
+        return self._trades
+        
+    @trades.setter
+    def trades(self, trades: List[Trade]) -> None:
+        self._trades = trades
+        self._curves = None
+        
+        # Columnar copies of the trade fields used by the plots
+        n = len(trades)
+        self._pos = np.fromiter((trade.position for trade in trades), dtype=np.int8, count=n)
+        self._pnl = np.fromiter((trade.pnl for trade in trades), dtype=np.float64, count=n)
+        self._entry_px = np.fromiter((trade.entry_price for trade in trades), dtype=np.float64, count=n)
+        self._exit_px = np.fromiter((trade.exit_price for trade in trades), dtype=np.float64, count=n)
+        self._entry_dt = pd.DatetimeIndex([trade.entry_date for trade in trades])
+        self._exit_dt = pd.DatetimeIndex([trade.exit_date for trade in trades])
+        
+    def _equity_curves(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the equity and drawdown curves aligned to the data index, computing them on first use.
+        
+        Each trade's return is applied on its exit date and the equity curve is
+        the cumulative product of those growth factors.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Equity values starting from 1.0, and drawdown
+        """
+        if self._curves is None:
+            # The curves are only drawn, so single precision is plenty
+            if self._buf_eq is None:
+                self._buf_eq = np.empty(len(self.data), dtype=np.float32)
+                self._buf_dd = np.empty(len(self.data), dtype=np.float32)
+            if len(self.trades) == 0:
+                # Flat equity and no drawdown, nothing to scan
+                self._buf_eq.fill(1.0)
+                self._buf_dd.fill(0.0)
+            else:
+                idx = np.searchsorted(self._x, self._exit_dt.values)
+                order = np.argsort(idx, kind='stable')
+                _equity_and_dd(idx[order], self._pnl[order], self._buf_eq, self._buf_dd)
+            self._curves = (self._buf_eq, self._buf_dd)
+        return self._curves
+        
     def plot_equity_curve(self, ax: plt.Axes = None) -> plt.Axes:
         """
         Plot the equity curve of the strategy.
@@ -30,17 +140,13 @@ class StrategyVisualizer:
             plt.Axes: The axes with the plot
         """
         if ax is None:
-            fig, ax = plt.subplots(figsize=(12, 6))
+            fig, ax = _get_plt().subplots(figsize=(12, 6))
             
         # Calculate cumulative returns
-        equity = pd.Series(1.0, index=self.data.index)
-        for trade in self.trades:
-            equity.loc[trade.exit_date] *= (1 + trade.pnl)
-            
-        equity = equity.cumprod()
+        equity, _ = self._equity_curves()
         
         # Plot equity curve
-        ax.plot(equity.index, equity.values, label='Strategy Equity')
+        ax.plot(self._x, equity, label='Strategy Equity')
         ax.set_title('Strategy Equity Curve')
         ax.set_xlabel('Date')
         ax.set_ylabel('Equity')
@@ -60,20 +166,13 @@ class StrategyVisualizer:
             plt.Axes: The axes with the plot
         """
         if ax is None:
-            fig, ax = plt.subplots(figsize=(12, 6))
+            fig, ax = _get_plt().subplots(figsize=(12, 6))
             
         # Calculate drawdown
-        equity = pd.Series(1.0, index=self.data.index)
-        for trade in self.trades:
-            equity.loc[trade.exit_date] *= (1 + trade.pnl)
-            
-        equity = equity.cumprod()
-        rolling_max = equity.expanding().max()
-        drawdown = (equity - rolling_max) / rolling_max
+        _, drawdown = self._equity_curves()
         
         # Plot drawdown
-        ax.fill_between(drawdown.index, drawdown.values, 0, color='red', alpha=0.3)
-        ax.plot(drawdown.index, drawdown.values, color='red', label='Drawdown')
+        ax.fill_between(self._x, drawdown, 0, color='red', alpha=0.3, label='Drawdown')
         ax.set_title('Strategy Drawdown')
         ax.set_xlabel('Date')
         ax.set_ylabel('Drawdown')
@@ -93,19 +192,20 @@ class StrategyVisualizer:
             plt.Axes: The axes with the plot
         """
         if ax is None:
-            fig, ax = plt.subplots(figsize=(12, 6))
+            fig, ax = _get_plt().subplots(figsize=(12, 6))
             
-        # Plot price
-        ax.plot(self.data.index, self.data['Close'], label='Price', alpha=0.5)
-        
-        # Plot trades
-        for trade in self.trades:
-            if trade.position == 1:  # Long trade
-                ax.scatter(trade.entry_date, trade.entry_price, color='green', marker='^', s=100)
-                ax.scatter(trade.exit_date, trade.exit_price, color='red', marker='v', s=100)
-            else:  # Short trade
-                ax.scatter(trade.entry_date, trade.entry_price, color='red', marker='v', s=100)
-                ax.scatter(trade.exit_date, trade.exit_price, color='green', marker='^', s=100)
+        # Plot price, downsampled for very long series
+        stride = max(1, len(self._close) // 20000)
+        ax.plot(self._x[::stride], self._close[::stride], label='Price', alpha=0.5, rasterized=True)
+        
+        # Plot trades, one scatter per marker group
+        if len(self.trades) > 0:
+            longs = self._pos == 1
+            shorts = ~longs
+            ax.scatter(self._entry_dt[longs], self._entry_px[longs], color='green', marker='^', s=100)
+            ax.scatter(self._exit_dt[longs], self._exit_px[longs], color='red', marker='v', s=100)
+            ax.scatter(self._entry_dt[shorts], self._entry_px[shorts], color='red', marker='v', s=100)
+            ax.scatter(self._exit_dt[shorts], self._exit_px[shorts], color='green', marker='^', s=100)
                 
         ax.set_title('Trades on Price Chart')
         ax.set_xlabel('Date')
@@ -126,14 +226,17 @@ class StrategyVisualizer:
             plt.Axes: The axes with the plot
         """
         if ax is None:
-            fig, ax = plt.subplots(figsize=(12, 6))
+            fig, ax = _get_plt().subplots(figsize=(12, 6))
             
-        # Plot volatility
-        ax.plot(self.data.index, self.data['Volatility'], label='Volatility', color='blue')
+        low_threshold, high_threshold = np.nanquantile(self._vol, [0.5, 0.9])
+        
+        # Plot volatility, downsampled for very long series since the plot is pixel-limited anyway
+        stride = max(1, len(self._vol) // 50000)
+        ax.plot(self._x[::stride], self._vol[::stride], label='Volatility', color='blue')
         
         # Plot regime thresholds
-        ax.axhline(y=self.data['Volatility'].quantile(0.9), color='red', linestyle='--', label='High Vol Regime')
-        ax.axhline(y=self.data['Volatility'].quantile(0.5), color='green', linestyle='--', label='Low Vol Regime')
+        ax.axhline(y=high_threshold, color='red', linestyle='--', label='High Vol Regime')
+        ax.axhline(y=low_threshold, color='green', linestyle='--', label='Low Vol Regime')
         
         ax.set_title('Volatility Regimes')
         ax.set_xlabel('Date')
@@ -146,31 +249,44 @@ class StrategyVisualizer:
     def plot_all(self) -> None:
         """
         Create a comprehensive dashboard of all plots and save to files.
+        
+        All four plots are rendered once on a shared 2x2 figure. The rendered
+        pixels are saved as plots/dashboard.png and cropped to each panel for
+        the individual files, with the PNG encoding done in parallel.
         """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
         # Create plots directory if it doesn't exist
         if not os.path.exists('plots'):
             os.makedirs('plots')
             
-        # Plot and save equity curve
-        fig, ax = plt.subplots(figsize=(15, 8))
-        self.plot_equity_curve(ax)
-        plt.savefig('plots/equity_curve.png')
-        plt.close()
-        
-        # Plot and save drawdown
-        fig, ax = plt.subplots(figsize=(15, 8))
-        self.plot_drawdown(ax)
-        plt.savefig('plots/drawdown.png')
-        plt.close()
-        
-        # Plot and save trades
-        fig, ax = plt.subplots(figsize=(15, 8))
-        self.plot_trades(ax)
-        plt.savefig('plots/trades.png')
-        plt.close()
-        
-        # Plot and save volatility regimes
-        fig, ax = plt.subplots(figsize=(15, 8))
-        self.plot_volatility_regimes(ax)
-        plt.savefig('plots/volatility_regimes.png')
-        plt.close() 
\ No newline at end of file
+        # Build the figure without pyplot so no global figure state is created
+        fig = Figure(figsize=(20, 12), dpi=100)
+        canvas = FigureCanvasAgg(fig)
+        axes = fig.subplots(2, 2)
+        panels = {
+            'equity_curve': self.plot_equity_curve(axes[0, 0]),
+            'drawdown': self.plot_drawdown(axes[0, 1]),
+            'trades': self.plot_trades(axes[1, 0]),
+            'volatility_regimes': self.plot_volatility_regimes(axes[1, 1])
+        }
+        fig.tight_layout()
+        canvas.draw()
+        pixels = np.asarray(canvas.buffer_rgba())
+        height, width = pixels.shape[:2]
+        
+        # Crop each panel, including its title and axis labels, out of the rendered pixels
+        paths = ['plots/dashboard.png']
+        images = [pixels]
+        renderer = canvas.get_renderer()
+        for name, ax in panels.items():
+            bbox = ax.get_tightbbox(renderer).expanded(1.02, 1.02)
+            left, right = max(int(bbox.x0), 0), min(int(np.ceil(bbox.x1)), width)
+            top, bottom = max(height - int(np.ceil(bbox.y1)), 0), min(height - int(bbox.y0), height)
+            paths.append(f'plots/{name}.png')
+            images.append(pixels[top:bottom, left:right])
+            
+        # Pillow releases the GIL while compressing, so threads encode and write in parallel
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_save_png, paths, images))
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.data_loader as data_loader
+
+
+@pytest.fixture
+def load_history(monkeypatch, tmp_path):
+    """Return a function that runs DataLoader.get_data on n synthetic daily bars."""
+    monkeypatch.setattr(data_loader, 'CACHE_DIR', str(tmp_path))
+    
+    def load(n_bars: int) -> pd.DataFrame:
+        rng = np.random.default_rng(n_bars)
+        index = pd.bdate_range('2020-01-02', periods=n_bars)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_bars)))
+        history = pd.DataFrame({
+            'Open': close, 'High': close * 1.01, 'Low': close * 0.99,
+            'Close': close, 'Volume': np.full(n_bars, 1e6)
+        }, index=index)
+        
+        class Ticker:
+            def __init__(self, symbol):
+                pass
+                
+            def history(self, start, end, interval):
+                return history.copy()
+                
+        monkeypatch.setattr(data_loader.yf, 'Ticker', Ticker)
+        return data_loader.DataLoader('TEST', '2020-01-01', '2021-01-01').get_data()
+        
+    return load
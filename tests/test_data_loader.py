@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from src.data_loader import _ema, EMA_SPAN, VOL_WINDOW
+
+
+def test_ema_matches_ewm_with_nan_inputs():
+    alpha = 2.0 / (EMA_SPAN + 1)
+    x = np.random.default_rng(0).normal(100, 5, 200)
+    x[:3] = np.nan  # leading NaNs
+    x[50] = np.nan  # isolated NaN
+    x[120:125] = np.nan  # gap
+    
+    expected = pd.Series(x).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(_ema(x, alpha), expected, rtol=1e-12, equal_nan=True)
+    np.testing.assert_allclose(_ema(x.astype(np.float32), alpha), expected, rtol=1e-5, equal_nan=True)
+
+
+def test_get_data_shorter_than_volatility_window_is_empty(load_history):
+    assert load_history(VOL_WINDOW - 1).empty
+
+
+def test_get_data_short_history(load_history):
+    data = load_history(35)
+    assert len(data) == 35 - VOL_WINDOW
+    assert not data.isna().any().any()
+
+
+def test_malformed_cache_ttl_disables_cache(load_history, monkeypatch):
+    monkeypatch.setenv('QV_CACHE_TTL_HOURS', 'one day')
+    assert len(load_history(35)) == 35 - VOL_WINDOW
@@ -0,0 +1,17 @@
+import pytest
+
+from src.strategy import VolatilityRegimeStrategy
+
+
+@pytest.mark.parametrize('n_rows', [1, 10, 13, 15, 19])
+def test_backtest_shorter_than_indicator_windows(load_history, n_rows):
+    data = load_history(35).iloc[:n_rows].copy()
+    metrics = VolatilityRegimeStrategy(data).run_backtest()
+    assert metrics['total_trades'] == 0
+
+
+def test_backtest_empty_frame(load_history):
+    data = load_history(35).iloc[:0].copy()
+    strategy = VolatilityRegimeStrategy(data)
+    assert strategy.run_backtest()['total_trades'] == 0
+    assert strategy.trades == []